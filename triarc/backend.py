@@ -5,8 +5,11 @@ The base class of all Triarc backends is here defined.
 """
 
 import logging
-import queue
-from typing import Set
+import math
+import traceback
+import uuid
+import weakref
+from typing import Iterable, List, Optional, Union
 
 import trio
 
@@ -22,37 +25,109 @@ class Backend:
     (and thus required) by the Triarc bot that will eventually use it.
     """
 
-    def __init__(self):
-        self.mutators = set()  # type: Set[Mutator]
+    # (Slots shave the per-instance __dict__ off and make attribute
+    # access on the hot dispatch path a slot lookup. Subclasses that
+    # want ad hoc attributes simply don't declare __slots__.)
+    __slots__ = (
+        "mutators",
+        "_listeners",
+        "_global_listeners",
+        "_dispatch_cache",
+        "_heavy_listeners",
+        "_heavy_send",
+        "_heavy_recv",
+        "stop_scopes",
+        "stop_scope_watcher",
+        "_stopped",
+        "logger",
+        "_listener_limiter",
+        "identifier",
+        "__weakref__",
+    )
+
+    def __init__(
+        self, max_listener_concurrency: int = 64, identifier: Optional[str] = None
+    ):
+        """
+        Keyword Arguments:
+            max_listener_concurrency {int} -- How many listeners may run
+                                              at once when dispatching
+                                              events. (default: 64)
+
+            identifier {Optional[str]} -- A string uniquely identifying
+                                          this backend. A random one is
+                                          generated if not supplied.
+                                          (default: None)
+        """
+
+        self.identifier = identifier or uuid.uuid4().hex
+
+        self.mutators = []  # type: List[Mutator]
 
         self._listeners = {}
         self._global_listeners = set()
+        self._dispatch_cache = {}
 
-        self.stop_scopes = set()
+        # Listeners registered with listen(heavy=True) are not run
+        # inline by receive_message; they are posted to this channel
+        # and consumed by a dedicated worker task instead.
+        self._heavy_listeners = {}
+        self._heavy_send, self._heavy_recv = trio.open_memory_channel(math.inf)
+
+        self.stop_scopes = weakref.WeakSet()
         self.stop_scope_watcher = None  # type: trio.NurseryManager
+        self._stopped = trio.Event()
+
+        self.logger = None  # type: logging.Logger
+
+        # Bounds how many listeners may run concurrently, so that a
+        # high-traffic event kind with many handlers doesn't flood the
+        # scheduler with tasks.
+        self._listener_limiter = trio.CapacityLimiter(max_listener_concurrency)
 
     def _register_mutator(self, mutator: Mutator):
-        self.mutators.add(mutator)
+        if mutator not in self.mutators:
+            self.mutators.append(mutator)
 
     def _mutate_reply(self, target: str, reply: str) -> str:
-        for mut in self.mutators:
+        muts = self.mutators
+
+        if not muts:
+            return reply
+
+        for mut in muts:
             reply = mut.modify_message(self, target, reply)
 
         return reply
 
-    def listen(self, name: str = "_"):
+    def listen(self, name: str = "_", *, heavy: bool = False):
         """Adds a listener for specific messages received in this backend.
         Use as a decorator generating method.
 
         Keyword Arguments:
             name {str} -- The name of the event to listen for (default: {'_'})
 
+            heavy {bool} -- Whether this listener does slow or heavy
+                            work. Heavy listeners are handed off to a
+                            dedicated worker task instead of running
+                            as part of the event dispatch, so they
+                            never hold up other listeners. The backend
+                            must be started for them to run.
+                            (default: False)
+
         Returns:
             function -- The decorator method.
         """
 
+        if heavy:
+            bucket = self._heavy_listeners.setdefault(name, set())
+
+        else:
+            bucket = self._listeners.setdefault(name, set())
+
         def _decorator(func):
-            self._listeners.setdefault(name, set()).add(func)
+            bucket.add(func)
+            self._dispatch_cache.pop(name, None)
             return func
 
         return _decorator
@@ -67,6 +142,11 @@ class Backend:
 
         def _decorator(func):
             self._global_listeners.add(func)
+
+            # A global listener is part of every per-kind entry, so the
+            # whole cache is stale.
+            self._dispatch_cache.clear()
+
             return func
 
         return _decorator
@@ -110,14 +190,95 @@ class Backend:
             data {any} -- The message's data.
         """
 
-        lists = self._listeners.get(kind, set()) | self._global_listeners
+        # Bind everything hot to locals; this method runs once per
+        # received message.
+        heavy = self._heavy_listeners.get(kind)
+
+        if heavy:
+            post_heavy = self._heavy_send.send_nowait
+
+            for listener in heavy:
+                post_heavy((listener, kind, data))
+
+        cache = self._dispatch_cache
+        listeners = cache.get(kind)
+
+        if listeners is None:
+            listeners = tuple(self._listeners.get(kind, ())) + tuple(
+                self._global_listeners
+            )
+            cache[kind] = listeners
+
+        if not listeners:
+            # Nobody to dispatch to; don't bother opening a nursery.
+            return
+
+        run_listener = self._run_listener
+
+        async with trio.open_nursery() as nursery:
+            start_soon = nursery.start_soon
+
+            for listener in listeners:
+                start_soon(run_listener, listener, kind, data)
+
+    async def _run_listener(self, listener, kind: str, data: any):
+        """Runs a single listener, guarding its siblings (and the
+        backend itself) against any exception it may raise.
+
+        Arguments:
+            listener {function} -- The listener to run.
+            kind {str} -- The kind of message being dispatched.
+            data {any} -- The message's data.
+        """
+
+        # (Listener exceptions are caught broadly on purpose, so that
+        # one faulty listener doesn't cancel the others.)
+        # pylint: disable=broad-except
+        try:
+            async with self._listener_limiter:
+                await listener(kind, data)
+
+        except Exception:
+            if self.logger:
+                self.logger.exception(
+                    "Error in listener %s for event %r", listener, kind
+                )
+
+            else:
+                traceback.print_exc()
+
+    @staticmethod
+    def construct_message_lines(*lines: Union[str, Iterable[str]]) -> str:
+        """Joins message lines, given either as strings or as iterables
+        of strings, into a single newline-separated message body.
+
+        Prefer this over concatenating lines one by one, which is
+        quadratic in the number of lines; str.join builds the result
+        in a single allocation.
+
+            >>> Backend.construct_message_lines('one', ['two', 'three'])
+            'one\\ntwo\\nthree'
+
+        Arguments:
+            *lines {Union[str, Iterable[str]]} -- The lines of the
+                                                  message, as any mix
+                                                  of strings and
+                                                  iterables thereof.
+
+        Returns:
+            str -- The lines, joined by newlines.
+        """
+
+        flat = []
 
-        for listener in lists:
-            await listener(kind, data)
+        for line in lines:
+            if isinstance(line, str):
+                flat.append(line)
 
-        # async with trio.open_nursery() as nursery:
-        #    for listener in lists:
-        #        nursery.start_soon(listener, kind, data)
+            else:
+                flat.extend(line)
+
+        return "\n".join(flat)
 
     async def start(self):
         """Starts the backend."""
@@ -173,15 +334,35 @@ class Backend:
         """
         return False
 
+    def _notify_stopped(self):
+        """Wakes every task that is waiting for this backend to stop,
+        such as the stop scope watcher. Called by subclasses whenever
+        the backend stops running."""
+
+        self._stopped.set()
+
+    async def _consume_heavy(self):
+        """Runs heavy listeners posted by receive_message, one at a
+        time, in their own task, keeping them off the hot dispatch
+        path. Started alongside the stop scope watcher."""
+
+        with self.new_stop_scope():
+            while True:
+                listener, kind, data = await self._heavy_recv.receive()
+                await self._run_listener(listener, kind, data)
+
     async def _watch_stop_scopes(self, on_loaded):
         async with trio.open_nursery() as nursery:
             self.stop_scope_watcher = nursery
 
+            # Reset the event, in case this backend is being restarted.
+            self._stopped = trio.Event()
+
             async def _run_until_stopped():
-                while self.running():
-                    await trio.sleep(0.05)
+                await self._stopped.wait()
 
             nursery.start_soon(_run_until_stopped)
+            nursery.start_soon(self._consume_heavy)
             nursery.start_soon(on_loaded)
 
     def new_stop_scope(self):
@@ -195,25 +376,14 @@ class Backend:
         Returns:
             trio.CancelScope -- The stop scope.
         """
-        scope = trio.CancelScope()
-        self.stop_scopes.add(scope)
-
-        if self.stop_scope_watcher:
-
-            async def watch_scope(scope):
-                while not scope.cancel_called:
-                    await trio.sleep(0.2)
-
-                self.stop_scopes.remove(scope)
-                del scope
-
-            self.stop_scope_watcher.start_soon(watch_scope, scope)
-
-        else:
+        if not self.stop_scope_watcher:
             raise RuntimeError(
                 "Tried to obtain a stop scope while the backend isn't running!"
             )
 
+        scope = trio.CancelScope()
+        self.stop_scopes.add(scope)
+
         return scope
 
 
@@ -223,16 +393,27 @@ class DuplexBackend(Backend):
     and receiving of message information.
     """
 
+    __slots__ = (
+        "_out_send",
+        "_out_recv",
+        "_heat",
+        "_max_heat",
+        "cooldown_hertz",
+        "throttle",
+    )
+
     def __init__(
         self,
         cooldown_hertz: float = 1.2,
         max_heat: int = 5,
         throttle: bool = True,
         logger: logging.Logger = None,
+        max_listener_concurrency: int = 64,
+        identifier: Optional[str] = None,
     ):
-        super().__init__()
+        super().__init__(max_listener_concurrency, identifier)
 
-        self._out_queue = queue.Queue()
+        self._out_send, self._out_recv = trio.open_memory_channel(math.inf)
         self._heat = 0
         self._max_heat = max_heat
         self.cooldown_hertz = cooldown_hertz
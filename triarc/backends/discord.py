@@ -139,8 +139,6 @@ class DiscordClient(DuplexBackend):
         self._token = token
         self.nickname = None
 
-        self._out_queue_in = None
-        self._out_queue_out = None
         self._heat = 0
         self.max_heat = max_heat
         self.cooldown_hertz = cooldown_hertz
@@ -175,37 +173,6 @@ class DiscordClient(DuplexBackend):
         async def on_ready():
             self.nickname = self.client.user.mention
 
-    def listen(self, name: str = "_"):
-        """Adds a listener for specific messages received in this backend.
-        Use as a decorator generating method.
-
-        Keyword Arguments:
-            name {str} -- The name of the event to listen for (default: {'_'})
-
-        Returns:
-            function -- The decorator method.
-        """
-
-        def _decorator(func):
-            self._listeners.setdefault(name, set()).add(func)
-            return func
-
-        return _decorator
-
-    def listen_all(self):
-        """Adds a listener for all messages received in this backend.
-        Use as a decorator generating method.
-
-        Returns:
-            function -- The decorator method.
-        """
-
-        def _decorator(func):
-            self._global_listeners.add(func)
-            return func
-
-        return _decorator
-
     def running(self):
         """Returns whether this client is still up and running.
 
@@ -244,7 +211,7 @@ class DiscordClient(DuplexBackend):
                                when sending.
         """
 
-        await self._out_queue_in.send(line)
+        await self._out_send.send(line)
 
     def next_send_time(self):
         """
@@ -297,7 +264,7 @@ class DiscordClient(DuplexBackend):
                 if next_time < time.time():
                     await trio.sleep(time.time() - next_time)
 
-                callback = await self._out_queue_out.receive()
+                callback = await self._out_recv.receive()
                 await callback()
 
                 self._last_send_time = time.time()
@@ -447,12 +414,12 @@ class DiscordClient(DuplexBackend):
 
         if embed:
             self._mutate_embed(target, message)
-            self._out_queue.put(
+            self._out_send.send_nowait(
                 self._message_embed_callback(target, message, reference=reference)
             )
 
         else:
-            self._out_queue.put(
+            self._out_send.send_nowait(
                 self._message_callback(
                     target,
                     self._mutate_reply(str(target.id), message),
@@ -476,6 +443,7 @@ class DiscordClient(DuplexBackend):
         await self.client.connect()
 
         self._running = False
+        self._notify_stopped()
 
     async def start(self):
         """Starts the Discord client."""
@@ -483,8 +451,6 @@ class DiscordClient(DuplexBackend):
         self._running = True
 
         try:
-            self._out_queue_in, self._out_queue_out = trio.open_memory_channel(0)
-
             async with trio.open_nursery() as nursery:
 
                 async def _loaded_stop_scopes():
@@ -497,8 +463,6 @@ class DiscordClient(DuplexBackend):
                 nursery.start_soon(self._watch_stop_scopes, _loaded_stop_scopes)
 
         finally:
-            await self._out_queue_out.aclose()
-
             self._running = False
 
     async def stop(self):
@@ -506,8 +470,9 @@ class DiscordClient(DuplexBackend):
             return False
 
         self._stopping = True
+        self._notify_stopped()
 
-        for scope in self.stop_scopes:
+        for scope in tuple(self.stop_scopes):
             scope.cancel()
 
         await self.client.close()
@@ -521,4 +486,4 @@ class DiscordClient(DuplexBackend):
         return True
 
     def deinit(self):
-        self._out_queue_in.aclose()
+        self._out_send.close()
@@ -305,7 +305,7 @@ class IRCConnection(DuplexBackend):
         async def post_wait():
             waiting[0] = False
 
-        self._out_queue.put((line, post_wait))
+        await self._out_send.send((line, post_wait))
 
         with self.new_stop_scope():
             while waiting[0]:
@@ -319,33 +319,56 @@ class IRCConnection(DuplexBackend):
 
         with self.new_stop_scope():
             while self.running():
-                while not self._out_queue.empty():
-                    if self.throttle:
-                        self._heat += 1
+                batch = self._drain_batch(await self._out_recv.receive())
 
-                        if self._heat > self._max_heat:
-                            break
+                if self.throttle:
+                    self._heat += 1
 
-                    item, on_send = self._out_queue.get()
+                    if self._heat > self._max_heat:
+                        # Overheated; wait for the cooldown loop to
+                        # bring the heat back down before sending.
+                        while self._heat:
+                            await trio.sleep(0.2)
 
-                    await self._send(item)
+                await self._send_batch([item for item, _ in batch])
 
+                for item, on_send in batch:
                     if on_send:
                         await on_send()
 
                     await self.receive_message("_SENT", item)
 
-                if self.running():
-                    if self._heat > self._max_heat and self.throttle:
-                        while self._heat:
-                            await trio.sleep(0.2)
+    def _drain_batch(self, first):
+        """Collects the given queued item, plus every other one that is
+        already waiting in the outgoing queue, into a single batch, so
+        that a burst of messages pays for only one unit of heat.
 
-                    else:
-                        await trio.sleep(0.05)
+        Arguments:
+            first -- The first (line, callback) item of the batch.
+
+        Returns:
+            list -- All (line, callback) items drained from the queue.
+        """
+
+        batch = [first]
+
+        while True:
+            try:
+                batch.append(self._out_recv.receive_nowait())
+
+            except trio.WouldBlock:
+                break
+
+        return batch
 
     async def _send(self, item: str):
         await self.connection.send_all(str(item).encode("utf-8") + b"\r\n")
 
+    async def _send_batch(self, items: List[str]):
+        await self.connection.send_all(
+            "".join(str(item) + "\r\n" for item in items).encode("utf-8")
+        )
+
     async def _receive(self, line: str):
         """
         This function is called asynchronously everytime
@@ -501,8 +524,9 @@ class IRCConnection(DuplexBackend):
 
     async def stop(self):
         self._stopping = True
+        self._notify_stopped()
 
-        for scope in self.stop_scopes:
+        for scope in tuple(self.stop_scopes):
             scope.cancel()
 
         await self.connection.aclose()
@@ -561,4 +585,4 @@ class IRCConnection(DuplexBackend):
         )
 
     def message_sync(self, target: str, message: str):
-        self._out_queue.put(("PRIVMSG {} :{}".format(target, message), None))
+        self._out_send.send_nowait(("PRIVMSG {} :{}".format(target, message), None))